@@ -319,6 +319,7 @@ class ConfigWidget(QWidget):
         self.db_manager.save_setting("budget_cap", str(self.budget_cap_spin.value()))
         self.db_manager.save_setting("trade_ltp_percentage", str(self.trade_ltp_percentage_spin.value()))
         self.api_keys_saved.emit()
+        self.config_saved.emit()
 
         QMessageBox.information(self, "Settings Saved", "Application settings have been saved successfully!")
 
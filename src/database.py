@@ -3,19 +3,49 @@ import datetime
 from typing import List, Tuple, Optional, Any, Dict
 from volume_data import VolumeData
 
+VOLUME_LOG_INSERT_SQL = """
+    INSERT INTO volume_logs (
+        timestamp, symbol, price, tbq, tsq, tbq_change_percent, tsq_change_percent, ratio, remark,
+        alert_triggered, is_baseline, open, high, low, close, instrument_type,
+        expiry_date, strike_price
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+TRADABLE_INSTRUMENT_INSERT_SQL = """
+    INSERT OR REPLACE INTO tradable_instruments (
+        instrument_token, exchange, tradingsymbol, instrument_type,
+        name, expiry, strike, lot_size, segment, tick_size, last_price
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSTRUMENT_INSERT_BATCH_SIZE = 1000
+
 class DatabaseManager:
-    def __init__(self, db_path="volume_monitor.db"):
+    def __init__(self, db_path="volume_monitor.db", fast_writes=False):
         self.db_path = db_path
+        self.fast_writes = fast_writes
         self.conn = None
         self.create_tables()
 
     def _get_connection(self):
         if self.conn is None:
             self.conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False)
-            self.conn.execute("PRAGMA journal_mode=WAL;")
+            self._apply_pragmas(self.conn)
             self.conn.row_factory = sqlite3.Row
         return self.conn
 
+    def _apply_pragmas(self, conn):
+        conn.execute("PRAGMA journal_mode=WAL;")
+        if not self.fast_writes:
+            return
+        # Only the volume-log writer opts in: synchronous=NORMAL under WAL skips the fsync on
+        # each commit, so a power cut can drop the last few log rows. Settings, tokens and
+        # trades keep the default FULL sync.
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA mmap_size=268435456;")
+        conn.execute("PRAGMA cache_size=-65536;")
+
     def reopen_connection(self):
         self.close()
         self._get_connection()
@@ -177,13 +207,26 @@ class DatabaseManager:
     def log_volume_data(self, data: VolumeData, remark: Optional[str] = None) -> int:
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO volume_logs (
-                timestamp, symbol, price, tbq, tsq, tbq_change_percent, tsq_change_percent, ratio, remark,
-                alert_triggered, is_baseline, open, high, low, close, instrument_type,
-                expiry_date, strike_price
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(VOLUME_LOG_INSERT_SQL, self._volume_log_params(data, remark))
+        conn.commit()
+        return cursor.lastrowid
+
+    def log_volume_data_many(self, rows: List[Tuple[VolumeData, Optional[str]]]):
+        params = [self._volume_log_params(data, remark) for data, remark in rows]
+        conn = self._get_connection()
+        if conn.in_transaction:
+            conn.commit()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(VOLUME_LOG_INSERT_SQL, params)
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+    @staticmethod
+    def _volume_log_params(data: VolumeData, remark: Optional[str]) -> Tuple:
+        return (
             data.timestamp,
             data.symbol,
             data.price,
@@ -202,9 +245,7 @@ class DatabaseManager:
             data.instrument_type,
             data.expiry_date,
             data.strike_price
-        ))
-        conn.commit()
-        return cursor.lastrowid
+        )
 
     def get_volume_logs(self, symbol: Optional[str] = None,
                         tbq_change_filter: Optional[Tuple[str, float]] = None,
@@ -245,7 +286,7 @@ class DatabaseManager:
         today_start = datetime.datetime.now().strftime("%Y-%m-%d 00:00:00")
         today_end = datetime.datetime.now().strftime("%Y-%m-%d 23:59:59")
         cursor.execute(
-            "SELECT COUNT(*) FROM volume_logs WHERE alert_triggered='True'",
+            "SELECT COUNT(*) FROM volume_logs WHERE alert_triggered='True' AND timestamp BETWEEN ? AND ?",
             (today_start, today_end)
         )
         return cursor.fetchone()[0]
@@ -339,30 +380,21 @@ class DatabaseManager:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        data_to_insert = []
-        for symbol, inst_type, exchange, token, expiry, strike in instruments_data:
-            data_to_insert.append((
-                token,
-                exchange,
-                symbol,
-                inst_type,
-                symbol,
-                expiry,
-                strike,
-                None,
-                None,
-                None,
-                None
-            ))
-        
-        cursor.executemany("""
-            INSERT OR REPLACE INTO tradable_instruments (
-                instrument_token, exchange, tradingsymbol, instrument_type,
-                name, expiry, strike, lot_size, segment, tick_size, last_price
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, data_to_insert)
-        conn.commit()
+        data_to_insert = [
+            (token, exchange, symbol, inst_type, symbol, expiry, strike, None, None, None, None)
+            for symbol, inst_type, exchange, token, expiry, strike in instruments_data
+        ]
 
+        if conn.in_transaction:
+            conn.commit()
+        try:
+            conn.execute("BEGIN")
+            for start in range(0, len(data_to_insert), INSTRUMENT_INSERT_BATCH_SIZE):
+                cursor.executemany(TRADABLE_INSTRUMENT_INSERT_SQL, data_to_insert[start:start + INSTRUMENT_INSERT_BATCH_SIZE])
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
 
     def clear_all_logs(self):
         conn = self._get_connection()
@@ -84,6 +84,7 @@ class LogsWidget(QWidget):
         self.logs_per_page = 50
         self.filtered_logs = []
         self._log_refreshing = False
+        self._refresh_pending = False
         self.init_ui()
         self.log_thread = None
         self.log_worker = None
@@ -395,6 +396,18 @@ class LogsWidget(QWidget):
             print(e)
 
 
+    def request_refresh(self):
+        if not self.isVisible():
+            self._refresh_pending = True
+            return
+        self.refresh_logs()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_logs()
+
     def handle_logs_refreshed(self, all_logs: List[Dict[str, Any]]):
         if not self:
             print("Error here")
@@ -1,23 +1,26 @@
 import sys
 import time
 import datetime
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QHeaderView,
     QLabel, QPushButton, QTabWidget, QFrame, QStatusBar, QMessageBox,
-    QLineEdit, QGroupBox, QTableWidget, QTableWidgetItem, QCompleter,
+    QLineEdit, QGroupBox, QCompleter,
     QAbstractItemView, QTableView
 )
 import simpleaudio as sa
 from pyqtspinner import WaitingSpinner
 from PyQt5.QtCore import (
-    QTimer, Qt, QStringListModel, QThread, QObject, pyqtSignal, QThreadPool, QRunnable,
-    QAbstractTableModel, QModelIndex, QMimeData, QDataStream, QByteArray, QIODevice
+    QTimer, Qt, QStringListModel, QThread, QObject, pyqtSignal, pyqtSlot, QThreadPool, QRunnable,
+    QAbstractTableModel, QSortFilterProxyModel, QModelIndex, QMimeData, QDataStream, QByteArray, QIODevice,
+    QMetaObject
 )
-from PyQt5.QtGui import QColor, QIcon, QKeyEvent, QDrag
+from PyQt5.QtGui import QColor, QIcon
 from config import ConfigWidget, AlertConfig
 from database import DatabaseManager
 from monitoring import MonitoringThread, VolumeData
+from volume_data import format_display_row
 from logs import LogsWidget
 from ui_elements import create_stat_card
 from stock_management import InstrumentManager, InstrumentSelectionWidget
@@ -27,7 +30,31 @@ from quotation_widget import TradingWidget
 from trading_dialog import TradingDialog
 from kiteconnect import KiteConnect
 import traceback
-from threading import Lock
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+_COLOR_DEFAULT = QColor(255, 255, 255)
+_COLOR_BOTH = QColor(192, 255, 192)
+_COLOR_RISE = QColor(173, 216, 230)
+_COLOR_FALL = QColor(255, 223, 186)
+
+_ROW_UPDATE_ROLES = [Qt.DisplayRole, Qt.BackgroundRole]
+_CELL_UPDATE_ROLES = [Qt.DisplayRole]
+_OHLC_KEYS = ('open', 'high', 'low', 'close')
+_EMPTY_OHLC: Dict[str, float] = {}
+_TELEGRAM_MAX_PENDING = 50
+_QUOTE_CACHE_TTL_S = 1.0
+_KITE_HTTP_POOL = {"pool_connections": 10, "pool_maxsize": 20}
+_EXCHANGE_BY_INSTRUMENT_TYPE = {
+    'EQ': KiteConnect.EXCHANGE_NSE,
+    'FUT': KiteConnect.EXCHANGE_NFO,
+    'CE': KiteConnect.EXCHANGE_NFO,
+    'PE': KiteConnect.EXCHANGE_NFO,
+}
+
+_STYLE_ORANGE = "background-color: #f0ad4e;"
+_STYLE_BLUE = "background-color: #5bc0de;"
 
 class VolumeDataTableModel(QAbstractTableModel):
     def __init__(self, data):
@@ -37,6 +64,25 @@ class VolumeDataTableModel(QAbstractTableModel):
             "Timestamp", "Symbol", "Type", "TBQ", "TBQ %", "TSQ", "TSQ %",
             "Remark", "Price", "Open", "High", "Low", "Close"
         ]
+        self._index: Dict[str, int] = {}
+        self._backgrounds: List[QColor] = []
+        self._reindex()
+        self._backgrounds = [self._row_background(volume_data, None) for volume_data in self._data]
+
+    def _reindex(self):
+        self._index = {volume_data.symbol: i for i, volume_data in enumerate(self._data)}
+
+    @staticmethod
+    def _row_background(volume_data, previous_price: Optional[float]) -> QColor:
+        remark = volume_data.remark or ""
+        if "TBQ" in remark and "TSQ" in remark:
+            return _COLOR_BOTH
+        if previous_price is not None and volume_data.price is not None:
+            if volume_data.price > previous_price:
+                return _COLOR_RISE
+            if volume_data.price < previous_price:
+                return _COLOR_FALL
+        return _COLOR_DEFAULT
 
     def rowCount(self, parent=QModelIndex()):
         return len(self._data)
@@ -45,26 +91,20 @@ class VolumeDataTableModel(QAbstractTableModel):
         return len(self._headers)
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid() or role != Qt.DisplayRole:
+        if not index.isValid():
             return None
-        volume_data = self._data[index.row()]
-        column = index.column()
-        mapping = {
-            0: volume_data.timestamp,
-            1: volume_data.symbol,
-            2: volume_data.instrument_type,
-            3: str(volume_data.tbq),
-            4: f"{volume_data.tbq_change_percent:.2f}%",
-            5: str(volume_data.tsq),
-            6: f"{volume_data.tsq_change_percent:.2f}%",
-            7: getattr(volume_data, 'remark', ""),
-            8: f"{volume_data.price:.2f}",
-            9: f"{volume_data.open_price:.2f}",
-            10: f"{volume_data.high_price:.2f}",
-            11: f"{volume_data.low_price:.2f}",
-            12: f"{volume_data.close_price:.2f}"
-        }
-        return mapping.get(column, "")
+        if role == Qt.BackgroundRole:
+            return self._backgrounds[index.row()]
+        if role != Qt.DisplayRole:
+            return None
+        return self._display_row(self._data[index.row()])[index.column()]
+
+    @staticmethod
+    def _display_row(volume_data) -> Tuple[str, ...]:
+        display_row = volume_data.display_row
+        if display_row is None:
+            display_row = volume_data.display_row = format_display_row(volume_data)
+        return display_row
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
@@ -87,9 +127,12 @@ class VolumeDataTableModel(QAbstractTableModel):
         mime_data = QMimeData()
         encoded_data = QByteArray()
         stream = QDataStream(encoded_data, QIODevice.WriteOnly)
-        rows = sorted(set(index.row() for index in indexes))
-        for row in rows:
-            stream.writeInt32(row)
+        seen = bytearray(self.rowCount())
+        for index in indexes:
+            seen[index.row()] = 1
+        for row, selected in enumerate(seen):
+            if selected:
+                stream.writeInt32(row)
         mime_data.setData('application/vnd.text.list', encoded_data)
         return mime_data
 
@@ -107,34 +150,207 @@ class VolumeDataTableModel(QAbstractTableModel):
 
         if row == -1:
             row = parent.row()
+        if row < 0:
+            row = len(self._data)
+
+        moving_rows = sorted(set(source_rows))
+        moving = set(moving_rows)
+        new_order = [i for i in range(row) if i not in moving]
+        new_order += moving_rows
+        new_order += [i for i in range(row, len(self._data)) if i not in moving]
+
+        self.layoutAboutToBeChanged.emit()
+        self._data[:] = [self._data[i] for i in new_order]
+        self._backgrounds[:] = [self._backgrounds[i] for i in new_order]
+        new_position = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_position[index.row()], index.column()) for index in old_indexes]
+        )
+        self._reindex()
+        self.layoutChanged.emit()
+        return True
 
-        items = [self._data[i] for i in source_rows]
-        for i in sorted(source_rows, reverse=True):
-            self.beginRemoveRows(QModelIndex(), i, i)
-            del self._data[i]
-            self.endRemoveRows()
+    def symbol_at(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self._data):
+            return self._data[row].symbol
+        return None
+
+    def row_of(self, symbol: str) -> int:
+        return self._index.get(symbol, -1)
+
+    def volume_data_at(self, row: int) -> Optional[VolumeData]:
+        if 0 <= row < len(self._data):
+            return self._data[row]
+        return None
+
+    def get(self, symbol: str) -> Optional[VolumeData]:
+        row = self._index.get(symbol)
+        return self._data[row] if row is not None else None
+
+    def symbols(self) -> List[str]:
+        return [volume_data.symbol for volume_data in self._data]
+
+    def upsert_many(self, rows) -> bool:
+        changes: Dict[int, Tuple[int, int, bool]] = {}
+        timestamp_rows: Dict[int, Tuple[int, int, bool]] = {}
+        new_rows: Dict[str, VolumeData] = {}
+        last_column = len(self._headers) - 1
+        for volume_data in rows:
+            row = self._index.get(volume_data.symbol)
+            if row is None:
+                new_rows[volume_data.symbol] = volume_data
+                continue
+            previous = self._data[row]
+            background = self._row_background(volume_data, previous.price)
+            background_changed = background != self._backgrounds[row]
+            old_cells = self._display_row(previous)
+            new_cells = self._display_row(volume_data)
+            self._data[row] = volume_data
+            self._backgrounds[row] = background
+            if background_changed:
+                changes[row] = (0, last_column, True)
+                continue
+            # The timestamp column moves on every poll; keep it out of the value span so a
+            # single changed number does not widen the repaint to the whole row.
+            if old_cells[0] != new_cells[0]:
+                timestamp_rows[row] = (0, 0, False)
+            changed_columns = [column for column in range(1, len(new_cells)) if old_cells[column] != new_cells[column]]
+            if changed_columns:
+                changes[row] = (changed_columns[0], changed_columns[-1], False)
+
+        self.update_rows(timestamp_rows)
+        self.update_rows(changes)
+
+        if not new_rows:
+            return False
+        first = len(self._data)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        for row, volume_data in enumerate(new_rows.values(), first):
+            self._data.append(volume_data)
+            self._backgrounds.append(self._row_background(volume_data, None))
+            self._index[volume_data.symbol] = row
+        self.endInsertRows()
+        return True
 
-        for i, item in enumerate(items):
-            self.beginInsertRows(QModelIndex(), row + i, row + i)
-            self._data.insert(row + i, item)
-            self.endInsertRows()
+    def update_rows(self, changes: Dict[int, Tuple[int, int, bool]]):
+        if not changes:
+            return
+        run = None
+        for row in sorted(changes):
+            first, last, background_changed = changes[row]
+            if run and row == run[1] + 1:
+                run[1] = row
+                run[2] = min(run[2], first)
+                run[3] = max(run[3], last)
+                run[4] = run[4] or background_changed
+                continue
+            if run:
+                self._emit_range_changed(*run)
+            run = [row, row, first, last, background_changed]
+        self._emit_range_changed(*run)
+
+    def _emit_range_changed(self, top: int, bottom: int, left: int, right: int, background_changed: bool):
+        roles = _ROW_UPDATE_ROLES if background_changed else _CELL_UPDATE_ROLES
+        self.dataChanged.emit(self.index(top, left), self.index(bottom, right), roles)
+
+class VolumeStats:
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, int, Optional[float], Optional[float]]] = {}
+        self._tbq_total = 0
+        self._tsq_total = 0
+        self._tbq_change_sum = 0.0
+        self._tsq_change_sum = 0.0
+        self._tbq_change_count = 0
+        self._tsq_change_count = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def update(self, volume_data: VolumeData) -> bool:
+        tbq = volume_data.tbq or 0
+        tsq = volume_data.tsq or 0
+        tbq_change = volume_data.tbq_change_percent
+        tsq_change = volume_data.tsq_change_percent
+
+        old = self._entries.get(volume_data.symbol)
+        if old is not None:
+            old_tbq, old_tsq, old_tbq_change, old_tsq_change = old
+            self._tbq_total -= old_tbq
+            self._tsq_total -= old_tsq
+            if old_tbq_change is not None:
+                self._tbq_change_sum -= old_tbq_change
+                self._tbq_change_count -= 1
+            if old_tsq_change is not None:
+                self._tsq_change_sum -= old_tsq_change
+                self._tsq_change_count -= 1
+
+        self._entries[volume_data.symbol] = (tbq, tsq, tbq_change, tsq_change)
+        self._tbq_total += tbq
+        self._tsq_total += tsq
+        if tbq_change is not None:
+            self._tbq_change_sum += tbq_change
+            self._tbq_change_count += 1
+        if tsq_change is not None:
+            self._tsq_change_sum += tsq_change
+            self._tsq_change_count += 1
+        return old is None
+
+    def totals(self):
+        avg_tbq_change = self._tbq_change_sum / self._tbq_change_count if self._tbq_change_count else 0.0
+        avg_tsq_change = self._tsq_change_sum / self._tsq_change_count if self._tsq_change_count else 0.0
+        return self._tbq_total, self._tsq_total, float(avg_tbq_change), float(avg_tsq_change)
+
+class SymbolFilterProxyModel(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._symbol: Optional[str] = None
+
+    def set_symbol(self, symbol: Optional[str]):
+        if symbol != self._symbol:
+            self._symbol = symbol
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._symbol is None or self.sourceModel().symbol_at(source_row) == self._symbol
+
+class AlertSoundTask(QRunnable):
+    def __init__(self, wave_obj):
+        super().__init__()
+        self.wave_obj = wave_obj
 
-        return True
+    def run(self):
+        try:
+            self.wave_obj.play()
+        except Exception as e:
+            print(e)
+
+class SymbolListSignals(QObject):
+    finished = pyqtSignal(int, list)
 
-    def update_data(self, new_data):
-        self.beginResetModel()
-        self._data = new_data
-        self.endResetModel()
+class SortedSymbolsTask(QRunnable):
+    def __init__(self, generation: int, instrument_lists: List[List[tuple]]):
+        super().__init__()
+        self.generation = generation
+        self.instrument_lists = instrument_lists
+        self.signals = SymbolListSignals()
+
+    def run(self):
+        symbols = [inst[0] for instruments in self.instrument_lists for inst in instruments]
+        sorted_symbols = sorted(set(symbols))
+        self.signals.finished.emit(self.generation, sorted_symbols)
 
 class QuotationFetcherWorker(QObject):
     live_data_update = pyqtSignal(VolumeData)
     error_occurred = pyqtSignal(str)
+    recovered = pyqtSignal(str)
     finished = pyqtSignal()
+    _target_changed = pyqtSignal()
 
-    def __init__(self, kite: KiteConnect, db_path: str):
+    def __init__(self, kite: KiteConnect):
         super().__init__()
         self.kite = kite
-        self.db_path = db_path
         self.symbol: Optional[str] = None
         self.instrument_token: Optional[int] = None
         self.instrument_type: Optional[str] = None
@@ -143,7 +359,20 @@ class QuotationFetcherWorker(QObject):
         self.strike_price: Optional[float] = None
         self._running = False
         self.refresh_interval = 2
-        self.db_manager: Optional[DatabaseManager] = None
+        self._full_symbol_key: Optional[str] = None
+        self._emit_live_data = self.live_data_update.emit
+        self._last_error_sig: Optional[str] = None
+        self._last_error_ts = 0.0
+        self._suppressed_errors = 0
+        self._last_warning: Optional[str] = None
+        self._last_traceback_type: Optional[str] = None
+        self._last_traceback_ts = 0.0
+        self._last_warning_ts = 0.0
+        self._last_epoch_s = 0
+        self._last_ts_str = ""
+        self._timer: Optional[QTimer] = None
+        self._quote_cache: Dict[str, tuple] = {}
+        self._target_changed.connect(self._poll_now)
 
     def set_instrument_details(self, symbol: str, instrument_token: int, instrument_type: str, exchange: str, expiry_date: Optional[str], strike_price: Optional[float]):
         self.symbol = symbol
@@ -152,134 +381,184 @@ class QuotationFetcherWorker(QObject):
         self.exchange = exchange
         self.expiry_date = expiry_date
         self.strike_price = strike_price
-        self._running = True
+        self._last_error_sig = None
+        self._suppressed_errors = 0
+        self._full_symbol_key = f"{exchange}:{symbol}" if symbol and instrument_token and exchange else None
+        self._target_changed.emit()
 
+    def clear_instrument(self):
+        self._full_symbol_key = None
+        self.symbol = None
 
     def stop(self):
         self._running = False
+        if self._timer is not None:
+            QMetaObject.invokeMethod(self._timer, "stop", Qt.QueuedConnection)
 
     def run(self):
-        self.db_manager = DatabaseManager(self.db_path)
-
         if not self.kite:
             self.error_occurred.emit("KiteConnect instance not available. Cannot fetch live quotes.")
             self.finished.emit()
             return
 
-        if not self.symbol or not self.instrument_token or not self.exchange:
-            self.error_occurred.emit("Instrument details not fully set for live quotation fetch.")
-            self.finished.emit()
+        self._running = True
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.refresh_interval * 1000)
+        self._timer.timeout.connect(self._poll)
+        self._poll_now()
+
+    @pyqtSlot()
+    def _poll_now(self):
+        if self._timer is None or not self._running:
             return
+        self._timer.start()
+        self._poll()
 
-        full_symbol_key = f"{self.exchange}:{self.symbol}"
-        while self._running:
-            try:
-                quote_data = self.kite.quote([full_symbol_key])
-                if quote_data and full_symbol_key in quote_data:
-                    tick = quote_data[full_symbol_key]
-                    current_timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                    last_price = tick.get('last_price')
-                    ohlc = tick.get('ohlc', {})
-
-                    if last_price is None:
-                        print(f"WARNING: No last_price for {self.symbol}. Skipping update for this tick.")
-                    else:
-                        buy_quantity = tick.get('buy_quantity', 0)
-                        sell_quantity = tick.get('sell_quantity', 0)
-                        ratio = buy_quantity / sell_quantity if sell_quantity else (buy_quantity / 0.0001 if buy_quantity else 0)
-                        data = VolumeData(
-                            timestamp=current_timestamp,
-                            symbol=self.symbol,
-                            instrument_type=self.instrument_type,
-                            price=last_price,
-                            tbq=buy_quantity,
-                            tsq=sell_quantity,
-                            ratio=ratio,
-                            open_price=ohlc.get('open'),
-                            high_price=ohlc.get('high'),
-                            low_price=ohlc.get('low'),
-                            close_price=ohlc.get('close'),
-                            expiry_date=self.expiry_date,
-                            strike_price=self.strike_price,
-                            tbq_change_percent=0.0,
-                            tsq_change_percent=0.0,
-                            day_high_tbq=None,
-                            day_low_tbq=None,
-                            day_high_tsq=None,
-                            day_low_tsq=None
-                        )
-                        self.live_data_update.emit(data)
+    def _poll(self):
+        full_symbol_key = self._full_symbol_key
+        if not self._running or full_symbol_key is None:
+            return
+        cached = self._quote_cache.get(full_symbol_key)
+        if cached and time.monotonic() - cached[0] < _QUOTE_CACHE_TTL_S:
+            self._emit_live_data(cached[1])
+            return
+        try:
+            quote_data = self.kite.quote([full_symbol_key])
+            if full_symbol_key != self._full_symbol_key:
+                return
+            tick = quote_data.get(full_symbol_key) if quote_data else None
+            if self._last_error_sig is not None:
+                self._last_error_sig = None
+                self._suppressed_errors = 0
+                self.recovered.emit(self.symbol)
+            if tick:
+                last_price = tick.get('last_price')
+
+                if last_price is None:
+                    self._warn(f"WARNING: No last_price for {self.symbol}. Skipping update for this tick.")
                 else:
-                    print(f"WARNING: QuotationFetcherWorker - No live quote data found for {self.symbol} in response or invalid response structure. Quote data: {quote_data}")
-
-            except Exception as e:
-                error_msg = f"Error fetching live quote for {self.symbol}: {traceback.format_exc()}"
-                self.error_occurred.emit(error_msg)
-            
-            time.sleep(self.refresh_interval)
-        if self.db_manager:
-            self.db_manager.close()
-        self.finished.emit()
-
-class DraggableTableWidget(QTableWidget):
-    enterPressed = pyqtSignal()
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.setDragEnabled(True)
-        self.setAcceptDrops(True)
-        self.setDropIndicatorShown(True)
-        self.setDragDropMode(QAbstractItemView.InternalMove)
-        self.viewport().setAcceptDrops(True)
-        self.setSelectionBehavior(QAbstractItemView.SelectRows)
-
-    def keyPressEvent(self, event: QKeyEvent):
-        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
-            self.enterPressed.emit()
-            event.accept()
-        else:
-            super().keyPressEvent(event)
-
-    def dropEvent(self, event):
-        source_row = self.currentRow()
-        pos = event.pos()
-        target_row = self.rowAt(pos.y())
-
-        if target_row == -1 or source_row == -1 or source_row == target_row:
-            return super().dropEvent(event)
-
-        row_data = [self.item(source_row, col).clone() if self.item(source_row, col) else QTableWidgetItem()
-                    for col in range(self.columnCount())]
-
-        self.insertRow(target_row)
+                    current_timestamp = self._timestamp()
+                    buy_quantity = tick.get('buy_quantity', 0)
+                    sell_quantity = tick.get('sell_quantity', 0)
+                    ratio = buy_quantity / sell_quantity if sell_quantity else buy_quantity * 10000.0
+                    open_price, high_price, low_price, close_price = map((tick.get('ohlc') or _EMPTY_OHLC).get, _OHLC_KEYS)
+                    volume_data = VolumeData(
+                        timestamp=current_timestamp,
+                        symbol=self.symbol,
+                        instrument_type=self.instrument_type,
+                        price=last_price,
+                        tbq=buy_quantity,
+                        tsq=sell_quantity,
+                        ratio=ratio,
+                        open_price=open_price,
+                        high_price=high_price,
+                        low_price=low_price,
+                        close_price=close_price,
+                        expiry_date=self.expiry_date,
+                        strike_price=self.strike_price,
+                        tbq_change_percent=0.0,
+                        tsq_change_percent=0.0
+                    )
+                    self._cache_quote(full_symbol_key, volume_data)
+                    self._emit_live_data(volume_data)
+            else:
+                self._warn(f"WARNING: QuotationFetcherWorker - No live quote data found for {self.symbol} in response or invalid response structure. Quote data: {quote_data}")
 
-        for col, item in enumerate(row_data):
-            self.setItem(target_row, col, item)
-        
-        if source_row > target_row:
-            self.removeRow(source_row + 1)
+        except Exception as e:
+            self._report_error(e)
+
+    def _cache_quote(self, full_symbol_key: str, volume_data: VolumeData):
+        now = time.monotonic()
+        if len(self._quote_cache) >= 32:
+            self._quote_cache = {k: v for k, v in self._quote_cache.items() if now - v[0] < _QUOTE_CACHE_TTL_S}
+        self._quote_cache[full_symbol_key] = (now, volume_data)
+
+    def _timestamp(self) -> str:
+        now = int(time.time())
+        if now != self._last_epoch_s:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._last_epoch_s = now
+        return self._last_ts_str
+
+    def _warn(self, message: str):
+        now = time.monotonic()
+        if message == self._last_warning and now - self._last_warning_ts < 30:
+            return
+        self._last_warning = message
+        self._last_warning_ts = now
+        print(message)
+
+    def _report_error(self, error: Exception):
+        error_sig = f"{type(error).__name__}:{str(error)[:80]}"
+        now = time.monotonic()
+        if error_sig == self._last_error_sig and now - self._last_error_ts < 30:
+            self._suppressed_errors += 1
+            return
+        error_type = type(error).__name__
+        if error_type != self._last_traceback_type or now - self._last_traceback_ts >= 60:
+            detail = traceback.format_exc()
+            self._last_traceback_type = error_type
+            self._last_traceback_ts = now
         else:
-            self.removeRow(source_row)
+            detail = f"{error_type}: {error}"
+        error_msg = f"Error fetching live quote for {self.symbol}: {detail}"
+        if self._suppressed_errors:
+            error_msg += f"\n({self._suppressed_errors} similar errors suppressed)"
+        self._last_error_sig = error_sig
+        self._last_error_ts = now
+        self._suppressed_errors = 0
+        self.error_occurred.emit(error_msg)
+
+class VolumeLoggerWorker(threading.Thread):
+    def __init__(self, db_path: str, flush_interval: float = 0.5, max_batch_size: int = 256):
+        super().__init__(daemon=True)
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.log_queue = queue.SimpleQueue()
+        self._stopping = False
 
-        event.accept()
+    def put(self, data: VolumeData, remark: Optional[str]):
+        self.log_queue.put((data, remark))
 
-class VolumeLoggerWorker(QRunnable):
-    def __init__(self, db_path, data, remark):
-        super().__init__()
-        self.db_path = db_path
-        self.data = data
-        self.remark = remark
+    def stop(self, timeout: float = 5.0):
+        self.log_queue.put(None)
+        self.join(timeout)
 
     def run(self):
+        db = DatabaseManager(self.db_path, fast_writes=True)
         try:
-            db = DatabaseManager(self.db_path)
-            db.log_volume_data(self.data, self.remark)
+            while not self._stopping:
+                batch = self._drain()
+                if not batch:
+                    continue
+                try:
+                    db.log_volume_data_many(batch)
+                except Exception as e:
+                    print(f"Volume logging error: {e}")
+        finally:
             db.close()
-        except Exception as e:
-            print(f"Volume logging error: {e}")
+
+    def _drain(self) -> List[tuple]:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.log_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._stopping = True
+                break
+            batch.append(item)
+        return batch
+
 class MainWindow(QMainWindow):
     init_success = pyqtSignal()
+    telegram_failed = pyqtSignal(str)
     def __init__(self):
         super().__init__()
         self.db_manager = DatabaseManager()
@@ -287,6 +566,8 @@ class MainWindow(QMainWindow):
         self.stock_manager = InstrumentManager(self.db_manager, instrument_type='EQ', user_table_name='user_stocks')
         self.futures_manager = InstrumentManager(self.db_manager, instrument_type='FUT', user_table_name='user_futures')
         self.options_manager = InstrumentManager(self.db_manager, instrument_type='OPT', user_table_name='user_options')
+        self._symbol_index: Mapping[str, tuple] = MappingProxyType({})
+        self._rebuild_symbol_index()
 
         print("1")
         self.config = AlertConfig(
@@ -297,26 +578,28 @@ class MainWindow(QMainWindow):
         self.config.load_settings_from_db(self.db_manager)
         self.config_widget = ConfigWidget(self.db_manager)
         self.kite = None
+        self._auto_trade_dialog: Optional[TradingDialog] = None
         self.monitoring_thread: Optional[MonitoringThread] = None
         self.request_token_server: Optional[RequestTokenServer] = None
         self.instrument_fetch_thread: Optional[InstrumentFetchThread] = None
 
-        self.current_live_data = {}
-        self.volume_data_log_queue = []
-
-        self.batch_log_timer = QTimer(self)
-        self.batch_log_timer.setInterval(3000)
-        self.batch_log_timer.timeout.connect(self.flush_log_queue)
-        self.batch_log_timer.start()
+        self.volume_stats = VolumeStats()
+        self.volume_logger = VolumeLoggerWorker(self.db_manager.db_path)
+        self.volume_logger.start()
+        self._telegram_pool = ThreadPoolExecutor(max_workers=2)
+        self._telegram_slots = threading.BoundedSemaphore(_TELEGRAM_MAX_PENDING)
 
         self.specific_monitored_symbol: Optional[str] = None
 
         self.end_of_day_timer = QTimer(self)
         self.end_of_day_timer.setSingleShot(True)
-        self.logger_threads = []
+        self._token_deadline: Optional[datetime.datetime] = None
 
         print("2")
         self.thread = QThreadPool()
+        self._completer_generation = 0
+        self._completer_sources: Optional[tuple] = None
+        self._completer_task: Optional[SortedSymbolsTask] = None
         QApplication.processEvents()
 
         print("3")
@@ -324,10 +607,15 @@ class MainWindow(QMainWindow):
         self.load_settings()
         self._initialize_kite_from_db_settings()
 
+        self._alerts_today_count = self.db_manager.get_alerts_count_today()
+        self._alerts_today_date = datetime.date.today()
+        self.update_stat_card("Total Alerts Today", str(self._alerts_today_count))
+        self.alerts_reset_timer = QTimer(self)
+        self.alerts_reset_timer.setSingleShot(True)
+        self.alerts_reset_timer.timeout.connect(self._reset_alerts_today_count)
+        self._schedule_alerts_reset()
+
         print("4")
-        self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.update_status_bar)
-        self.status_timer.start(1000)
 
     def init_ui(self):
         self.setWindowTitle("VtQube v1.0.4")
@@ -349,8 +637,8 @@ class MainWindow(QMainWindow):
                             roundness=100.0,
                             fade=80.0,
                             radius=30,
-                            lines=29,
-                            line_length=15,
+                            lines=12,
+                            line_length=12,
                             line_width=8,
                             speed=1.5707963267948966,
                             color=QColor(0, 0, 255)
@@ -358,6 +646,7 @@ class MainWindow(QMainWindow):
         self.tab_widget.addTab(self.config_widget, "Configuration")
         self.config_widget.api_keys_saved.connect(self.on_api_keys_saved)
         self.config_widget.login_success.connect(self.on_login_success)
+        self.config_widget.config_saved.connect(self.update_auto_trade_config)
 
         instruments_main_tab = QWidget()
         instruments_main_layout = QVBoxLayout()
@@ -375,10 +664,12 @@ class MainWindow(QMainWindow):
         self.instrument_sub_tab_widget.addTab(self.futures_selection_widget, "Futures")
         self.instrument_sub_tab_widget.addTab(self.options_selection_widget, "Options")
 
-        monitoring_tab = QWidget()
+        self.monitoring_tab = QWidget()
         monitoring_layout = QVBoxLayout()
-        monitoring_tab.setLayout(monitoring_layout)
-        self.tab_widget.addTab(monitoring_tab, "Monitoring")
+        self.monitoring_tab.setLayout(monitoring_layout)
+        self.tab_widget.addTab(self.monitoring_tab, "Monitoring")
+        self._pending_rows: Dict[str, VolumeData] = {}
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         control_frame = QFrame()
         control_layout = QHBoxLayout()
@@ -390,13 +681,13 @@ class MainWindow(QMainWindow):
         control_layout.addWidget(self.start_monitor_btn)
 
         self.toggle_pause_resume_btn = QPushButton("Pause Monitoring")
-        self.toggle_pause_resume_btn.setStyleSheet("background-color: #f0ad4e;")
+        self.toggle_pause_resume_btn.setStyleSheet(_STYLE_ORANGE)
         self.toggle_pause_resume_btn.clicked.connect(self.toggle_monitoring_state)
         self.toggle_pause_resume_btn.setEnabled(False)
         control_layout.addWidget(self.toggle_pause_resume_btn)
 
         self.stop_monitor_btn = QPushButton("Stop Monitoring")
-        self.stop_monitor_btn.clicked.connect(self.stop_monitoring)
+        self.stop_monitor_btn.clicked.connect(lambda: self.stop_monitoring(restart_trading_feed=True))
         self.stop_monitor_btn.setEnabled(False)
         control_layout.addWidget(self.stop_monitor_btn)
 
@@ -421,7 +712,9 @@ class MainWindow(QMainWindow):
         self.live_data = []
         self.table_model = VolumeDataTableModel(self.live_data)
         self.live_data_table = QTableView(self)
-        self.live_data_table.setModel(self.table_model)
+        self.table_proxy = SymbolFilterProxyModel(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        self.live_data_table.setModel(self.table_proxy)
         self.live_data_table.setDragDropMode(QTableView.InternalMove)
         self.live_data_table.setDragEnabled(True)
         self.live_data_table.setAcceptDrops(True)
@@ -462,7 +755,33 @@ class MainWindow(QMainWindow):
         self.log_refresh_timer = QTimer(self)
         self.log_refresh_timer.setSingleShot(True)
         self.log_refresh_timer.setInterval(10000)
-        self.log_refresh_timer.timeout.connect(self.logs_widget.refresh_logs)
+        self.log_refresh_timer.timeout.connect(self.logs_widget.request_refresh)
+
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setSingleShot(True)
+        self.stats_timer.setInterval(250)
+        self.stats_timer.timeout.connect(self.update_monitoring_stat_cards)
+
+        self.table_flush_timer = QTimer(self)
+        self.table_flush_timer.setSingleShot(True)
+        self.table_flush_timer.setInterval(100)
+        self.table_flush_timer.timeout.connect(self._flush_pending_rows)
+
+        self._alert_wave = None
+        self._pending_alerts = []
+        self.alert_flush_timer = QTimer(self)
+        self.alert_flush_timer.setSingleShot(True)
+        self.alert_flush_timer.setInterval(100)
+        self.alert_flush_timer.timeout.connect(self._flush_alerts)
+
+        self._pending_errors = []
+        self._shown_errors: List[str] = []
+        self._omitted_errors = 0
+        self._error_box: Optional[QMessageBox] = None
+        self.error_flush_timer = QTimer(self)
+        self.error_flush_timer.setSingleShot(True)
+        self.error_flush_timer.setInterval(2000)
+        self.error_flush_timer.timeout.connect(self._flush_errors)
 
         self.quotation_fetcher_thread: Optional[QThread] = None
         self.quotation_fetcher_worker: Optional[QuotationFetcherWorker] = None
@@ -471,6 +790,7 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_label = QLabel("Status: Stopped")
         self.status_bar.addWidget(self.status_label)
+        self.telegram_failed.connect(lambda symbol: self.status_bar.showMessage(f"Telegram alert for {symbol} could not be sent.", 5000))
 
     def init_stat_cards(self):
         self.stat_cards = {}
@@ -498,31 +818,51 @@ class MainWindow(QMainWindow):
         else:
             pass
     
+    def _schedule_alerts_reset(self):
+        now = datetime.datetime.now()
+        next_midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time.min)
+        self.alerts_reset_timer.start(int((next_midnight - now).total_seconds() * 1000) + 1000)
+
+    def _roll_alerts_today_count(self):
+        today = datetime.date.today()
+        if today != self._alerts_today_date:
+            self._alerts_today_date = today
+            self._alerts_today_count = 0
+
+    def _reset_alerts_today_count(self):
+        self._roll_alerts_today_count()
+        self.update_stat_card("Total Alerts Today", str(self._alerts_today_count))
+        self._schedule_alerts_reset()
+
     def _on_kite_init_success(self):
         self.trading_widget.kite = self.kite
         self.trading_widget.load_all_tradable_instruments()
         self.trading_widget.fetch_and_display_account_info()
     
+    def _is_symbol_monitored(self, symbol: str) -> bool:
+        return bool(self.monitoring_thread and self.monitoring_thread.isRunning()
+                    and symbol in self.monitoring_thread.monitored_symbols)
+
     def _start_specific_symbol_quotation_fetch(self, symbol: str):
         self._stop_specific_symbol_quotation_fetch()
 
+        if self._is_symbol_monitored(symbol):
+            latest = self._pending_rows.get(symbol) or self.table_model.get(symbol)
+            if latest:
+                self.trading_widget.update_quotation_data(latest)
+            return
+
         if not self.kite:
             QMessageBox.warning(self, "KiteConnect Error", "KiteConnect is not initialized. Cannot fetch live quotes.")
             return
 
-        instrument_details = (
-            self.stock_manager.get_tradable_instrument_details(symbol) or
-            self.futures_manager.get_tradable_instrument_details(symbol) or
-            self.options_manager.get_tradable_instrument_details(symbol)
-        )
+        instrument_details = self._symbol_index.get(symbol)
         if not instrument_details:
             QMessageBox.warning(self, "Instrument Not Found", f"Could not find details for instrument: {symbol}. Cannot fetch live quotes.")
             return
         
         _symbol, _inst_type, _exchange, _token, _expiry, _strike = instrument_details
-        self.quotation_fetcher_thread = QThread()
-        self.quotation_fetcher_worker = QuotationFetcherWorker(self.kite, self.db_manager.db_path)
-        
+        self._ensure_quotation_fetcher()
         self.quotation_fetcher_worker.set_instrument_details(
             symbol=_symbol,
             instrument_token=_token,
@@ -531,35 +871,56 @@ class MainWindow(QMainWindow):
             expiry_date=_expiry,
             strike_price=_strike
         )
+
+    def _ensure_quotation_fetcher(self):
+        if self.quotation_fetcher_worker is not None:
+            self.quotation_fetcher_worker.kite = self.kite
+            return
+
+        self.quotation_fetcher_thread = QThread()
+        self.quotation_fetcher_worker = QuotationFetcherWorker(self.kite)
         self.quotation_fetcher_worker.moveToThread(self.quotation_fetcher_thread)
         self.quotation_fetcher_thread.started.connect(self.quotation_fetcher_worker.run)
         self.quotation_fetcher_worker.live_data_update.connect(self.trading_widget.update_quotation_data)
         self.quotation_fetcher_worker.error_occurred.connect(
-            lambda msg: QMessageBox.critical(self, "Live Data Error (Trading)", msg), 
+            lambda msg: self._queue_error("Live Data Error (Trading)", msg),
             Qt.QueuedConnection
         )
         
-        self.quotation_fetcher_worker.finished.connect(self.quotation_fetcher_thread.quit)
-        self.quotation_fetcher_worker.finished.connect(self.quotation_fetcher_worker.deleteLater)
+        self.quotation_fetcher_worker.recovered.connect(
+            lambda symbol: self.status_bar.showMessage(f"Live quotes for {symbol} recovered", 5000)
+        )
+        self.quotation_fetcher_worker.finished.connect(self._shutdown_quotation_fetcher)
+        self.quotation_fetcher_thread.finished.connect(self.quotation_fetcher_worker.deleteLater)
         self.quotation_fetcher_thread.finished.connect(self.quotation_fetcher_thread.deleteLater)
 
         self.quotation_fetcher_thread.start()
 
+    def _hand_trading_symbol_to_monitoring(self, monitored_symbols: List[str]):
+        trading_symbol = self.trading_widget.current_symbol
+        if trading_symbol and trading_symbol in monitored_symbols:
+            self._stop_specific_symbol_quotation_fetch(trading_symbol)
+
     def _stop_specific_symbol_quotation_fetch(self, symbol: str = None):
-        if self.quotation_fetcher_worker and self.quotation_fetcher_thread and self.quotation_fetcher_thread.isRunning():
-            if symbol is None or self.quotation_fetcher_worker.symbol == symbol:
-                self.quotation_fetcher_worker.stop()
-                self.quotation_fetcher_thread.quit()
-                if not self.quotation_fetcher_thread.wait(5000):
-                    print(f"WARNING: Quotation fetcher thread for {self.quotation_fetcher_worker.symbol} did not terminate gracefully within timeout.")
-                
-                self.quotation_fetcher_thread = None
-                self.quotation_fetcher_worker = None
-            else:
-                print(f"DEBUG: MainWindow - Not stopping quotation fetcher for {self.quotation_fetcher_worker.symbol} as requested symbol was {symbol}.")
+        if self.quotation_fetcher_worker is None:
+            return
+        if symbol is None or self.quotation_fetcher_worker.symbol == symbol:
+            self.quotation_fetcher_worker.clear_instrument()
+
+    def _shutdown_quotation_fetcher(self):
+        if self.quotation_fetcher_worker is None:
+            return
+        self.quotation_fetcher_worker.stop()
+        self.quotation_fetcher_thread.quit()
+        if not self.quotation_fetcher_thread.wait(5000):
+            # Dropping the last reference to a running QThread aborts the process.
+            print("WARNING: Quotation fetcher thread did not terminate gracefully within timeout.")
+            return
+        self.quotation_fetcher_thread = None
+        self.quotation_fetcher_worker = None
 
     def update_monitoring_stat_cards(self):
-        total_monitored = len(self.current_live_data)
+        total_monitored = len(self.volume_stats)
         self.update_stat_card("Monitored Instruments", str(total_monitored))
 
         if total_monitored == 0:
@@ -569,34 +930,18 @@ class MainWindow(QMainWindow):
             self.update_stat_card("Avg TSQ Change %", "0.00%")
             return
 
-        total_tbq = sum(data.tbq for data in self.current_live_data.values() if data.tbq is not None)
-        total_tsq = sum(data.tsq for data in self.current_live_data.values() if data.tsq is not None)
-
-        avg_tbq_change_percent = 0.0
-        avg_tsq_change_percent = 0.0
-        
-        valid_tbq_changes = [data.tbq_change_percent for data in self.current_live_data.values() if data.tbq_change_percent is not None]
-        valid_tsq_changes = [data.tsq_change_percent for data in self.current_live_data.values() if data.tsq_change_percent is not None]
-
-        if valid_tbq_changes:
-            avg_tbq_change_percent = sum(valid_tbq_changes) / len(valid_tbq_changes) * 100
-        if valid_tsq_changes:
-            avg_tsq_change_percent = sum(valid_tsq_changes) / len(valid_tsq_changes) * 100
+        total_tbq, total_tsq, avg_tbq_change, avg_tsq_change = self.volume_stats.totals()
 
         self.update_stat_card("Total TBQ", f"{total_tbq:,}")
         self.update_stat_card("Total TSQ", f"{total_tsq:,}")
-        self.update_stat_card("Avg TBQ Change %", f"{avg_tbq_change_percent:.2f}%")
-        self.update_stat_card("Avg TSQ Change %", f"{avg_tsq_change_percent:.2f}%")
+        self.update_stat_card("Avg TBQ Change %", f"{avg_tbq_change * 100:.2f}%")
+        self.update_stat_card("Avg TSQ Change %", f"{avg_tsq_change * 100:.2f}%")
 
     def load_settings(self):
         self.config_widget.load_settings()
     
     def apply_display_order_to_monitoring(self):
-        new_monitored_order = []
-        for row in range(self.live_data_table.rowCount()):
-            symbol_item = self.live_data_table.item(row, 1)
-            if symbol_item:
-                new_monitored_order.append(symbol_item.text())
+        new_monitored_order = self.table_model.symbols()
 
         if not new_monitored_order:
             QMessageBox.warning(self, "No Instruments", "No instruments displayed in the table to reorder.")
@@ -627,7 +972,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Error", "KiteConnect library not found. Please install it (`pip install kiteconnect`).")
                 return
 
-            self.kite = KiteConnect(api_key=api_key)
+            self.kite = KiteConnect(api_key=api_key, pool=_KITE_HTTP_POOL)
         else:
             QMessageBox.warning(self, "Missing API Keys", "Please provide Kite API Key and API Secret.")
             self.start_monitor_btn.setEnabled(False)
@@ -647,44 +992,56 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Login Error", "KiteConnect instance not initialized. Please ensure API keys are saved.")
             self.start_monitor_btn.setEnabled(False)
 
+    def _rebuild_symbol_index(self):
+        symbol_index = {}
+        for manager in (self.stock_manager, self.futures_manager, self.options_manager):
+            for instrument in manager.all_tradable_symbols:
+                symbol_index.setdefault(instrument[0], instrument)
+        self._symbol_index = MappingProxyType(symbol_index)
+
     def _populate_completer_with_all_tradable_symbols(self):
-        all_symbols = set()
-        all_symbols.update(inst[0] for inst in self.stock_manager.all_tradable_symbols)
-        all_symbols.update(inst[0] for inst in self.futures_manager.all_tradable_symbols)
-        all_symbols.update(inst[0] for inst in self.options_manager.all_tradable_symbols)
-        self.completer_model.setStringList(sorted(list(all_symbols)))
+        sources = (
+            self.stock_manager.all_tradable_symbols,
+            self.futures_manager.all_tradable_symbols,
+            self.options_manager.all_tradable_symbols
+        )
+        if self._completer_sources and all(a is b for a, b in zip(sources, self._completer_sources)):
+            return
+        self._completer_sources = sources
+
+        self._rebuild_symbol_index()
+        self._completer_generation += 1
+        self._completer_task = SortedSymbolsTask(self._completer_generation, list(sources))
+        self._completer_task.signals.finished.connect(self._on_completer_symbols_sorted)
+        self.thread.start(self._completer_task)
+
+    def _on_completer_symbols_sorted(self, generation: int, symbols: List[str]):
+        if generation == self._completer_generation:
+            self.completer_model.setStringList(symbols)
 
     def set_specific_monitored_symbol(self):
         symbol = self.specific_symbol_input.text().strip().upper()
         if symbol:
-            is_valid_symbol = False
-            if self.stock_manager.get_tradable_instrument_details(symbol) or \
-               self.futures_manager.get_tradable_instrument_details(symbol) or \
-               self.options_manager.get_tradable_instrument_details(symbol):
-                is_valid_symbol = True
-
-            if is_valid_symbol:
+            if symbol in self._symbol_index:
                 self.specific_monitored_symbol = symbol
+                self.table_proxy.set_symbol(symbol)
                 QMessageBox.information(self, "Monitoring Selection", f"Monitoring set to: {symbol}")
             else:
                 QMessageBox.warning(self, "Invalid Symbol", f"'{symbol}' is not a valid tradable instrument.")
                 self.specific_symbol_input.clear()
                 self.specific_monitored_symbol = None
+                self.table_proxy.set_symbol(None)
         else:
             self.specific_monitored_symbol = None
+            self.table_proxy.set_symbol(None)
             QMessageBox.information(self, "Monitoring Selection", "Monitoring reverted to all user-selected instruments.")
     
     def on_monitoring_table_double_clicked(self, index):
-        row = index.row()
+        row = self.table_proxy.mapToSource(index).row()
         if row < 0:
             return
 
-        symbol_item = self.live_data_table.item(row, 1)
-        if not symbol_item:
-            return
-
-        symbol = symbol_item.text()
-        live_data_for_symbol = self.current_live_data.get(symbol)
+        live_data_for_symbol = self.table_model.volume_data_at(row)
 
         if live_data_for_symbol:
             dialog_data = {
@@ -697,7 +1054,7 @@ class MainWindow(QMainWindow):
             }
             self.open_trading_dialog(dialog_data)
         else:
-            QMessageBox.warning(self, "Trade Error", f"Could not retrieve live data for {symbol} to open trading dialog.")
+            QMessageBox.warning(self, "Trade Error", "Could not retrieve live data for the selected row to open trading dialog.")
     
     def _initialize_kite_from_db_settings(self):
         api_key = self.db_manager.get_setting("api_key")
@@ -706,7 +1063,7 @@ class MainWindow(QMainWindow):
 
         if api_key and api_secret:
             try:
-                self.kite = KiteConnect(api_key=api_key)
+                self.kite = KiteConnect(api_key=api_key, pool=_KITE_HTTP_POOL)
                 if access_token:
                     self.kite.set_access_token(access_token)
                     self.config.access_token = access_token
@@ -758,6 +1115,8 @@ class MainWindow(QMainWindow):
         self.stock_manager.load_all_tradable_instruments_from_db()
         self.futures_manager.load_all_tradable_instruments_from_db()
         self.options_manager.load_all_tradable_instruments_from_db()
+        if self.monitoring_thread:
+            self.monitoring_thread.invalidate_token_batches()
 
         self.stock_selection_widget.populate_all_symbols()
         self.futures_selection_widget.populate_all_symbols()
@@ -780,28 +1139,25 @@ class MainWindow(QMainWindow):
         self._schedule_access_token_deletion()
 
     def _schedule_access_token_deletion(self):
-        self.end_of_day_timer.stop()
         end_time_config = self.config.end_time
         if end_time_config is None:
             QMessageBox.warning(self, "Save Settings Failed!", "End time not configured in settings. Cannot schedule access token deletion.")
             return
 
         now = datetime.datetime.now()
-        end_time_today = datetime.datetime(now.year, now.month, now.day,
-                                            end_time_config.hour, end_time_config.minute,
-                                            end_time_config.second)
-
-        delay_seconds = 0.0
-        if now < end_time_today:
-            delay_seconds = (end_time_today - now).total_seconds()
-        else:
-            end_time_tomorrow = end_time_today + datetime.timedelta(days=1)
-            delay_seconds = (end_time_tomorrow - now).total_seconds()
+        deadline = datetime.datetime.combine(now.date(), end_time_config)
+        if now >= deadline:
+            deadline += datetime.timedelta(days=1)
+        if self.end_of_day_timer.isActive() and deadline == self._token_deadline:
+            return
+        self.end_of_day_timer.stop()
+        self._token_deadline = deadline
 
-        if delay_seconds > 0:
-            self.end_of_day_timer.start(int(delay_seconds * 1000))
+        delay_ms = int((deadline - now).total_seconds() * 1000)
+        if delay_ms > 0:
+            self.end_of_day_timer.start(delay_ms)
         else:
-            QMessageBox.warning(self, "Calculated delay for token deletion is zero or negative. Deleting token immediately.")
+            QMessageBox.warning(self, "Token Deletion", "Calculated delay for token deletion is zero or negative. Deleting token immediately.")
             self._delete_access_token_and_reschedule()
 
     def start_monitoring(self):
@@ -833,29 +1189,30 @@ class MainWindow(QMainWindow):
             db_path=self.db_manager.db_path,
             stock_manager=self.stock_manager,
             futures_manager=self.futures_manager,
-            options_manager=self.options_manager
+            options_manager=self.options_manager,
+            parent=self
         )
         self.monitoring_thread.volume_batch_update.connect(self.update_live_data_table_batch)
         self.monitoring_thread.set_monitored_symbols(monitored_symbols_for_thread)
-        
-        self.monitoring_thread.volume_batch_update.connect(
-            self.handle_volume_batch,
-            Qt.QueuedConnection
-        )
+
         self.monitoring_thread.alert_triggered.connect(
             self.on_alert_triggered,
             Qt.QueuedConnection
         )
+        # Every MonitoringThread signal is emitted from its worker thread, so none of them
+        # may touch widgets through a direct connection.
         self.monitoring_thread.status_changed.connect(
             self.status_label.setText,
-            Qt.DirectConnection
+            Qt.QueuedConnection
         )
         self.monitoring_thread.error_occurred.connect(
-            lambda msg: QMessageBox.critical(self, "Monitoring Error", msg),
+            lambda msg: self._queue_error("Monitoring Error", msg),
             Qt.QueuedConnection
         )
+        self.monitoring_thread.finished.connect(self.update_status_bar)
         
         self.monitoring_thread.start()
+        self._hand_trading_symbol_to_monitoring(monitored_symbols_for_thread)
         
         self.start_monitor_btn.setEnabled(False)
         self.toggle_pause_resume_btn.setEnabled(True)
@@ -867,64 +1224,57 @@ class MainWindow(QMainWindow):
             if self.monitoring_thread.paused:
                 self.monitoring_thread.resume_monitoring()
                 self.toggle_pause_resume_btn.setText("Pause Monitoring")
-                self.toggle_pause_resume_btn.setStyleSheet("background-color: #f0ad4e;")
+                self.toggle_pause_resume_btn.setStyleSheet(_STYLE_ORANGE)
                 self.status_label.setText("Status: Running")
             else:
                 self.monitoring_thread.pause_monitoring()
                 self.toggle_pause_resume_btn.setText("Resume Monitoring")
-                self.toggle_pause_resume_btn.setStyleSheet("background-color: #5bc0de;")
+                self.toggle_pause_resume_btn.setStyleSheet(_STYLE_BLUE)
                 self.status_label.setText("Status: Paused")
 
-    def handle_volume_batch(self, batch: List[VolumeData]):
-        self.update_live_data_table_batch(batch)
-    
     def update_live_data_table_batch(self, batch: List[VolumeData]):
-        symbol_index = {v.symbol: i for i, v in enumerate(self.live_data)}
+        table_visible = self.tab_widget.currentWidget() is self.monitoring_tab
+        trading_symbol = self.trading_widget.current_symbol
         for data in batch:
-            if data.symbol not in self.current_live_data:
+            if data.symbol == trading_symbol:
+                self.trading_widget.update_quotation_data(data)
+            if self.volume_stats.update(data):
                 data.is_baseline = True
-            if data.symbol in symbol_index:
-                self.live_data[symbol_index[data.symbol]] = data
-            else:
-                self.live_data.append(data)
+            self._pending_rows[data.symbol] = data
             if data.alert_triggered or data.is_baseline:
-                self.volume_data_log_queue.append((data, data.remark))
-        
-        self.update_monitoring_stat_cards()
-        self.table_model.update_data(self.live_data)
+                self.volume_logger.put(data, data.remark)
+
+        if table_visible and not self.table_flush_timer.isActive():
+            self.table_flush_timer.start()
+        if not self.stats_timer.isActive():
+            self.stats_timer.start()
 
         if not self.log_refresh_timer.isActive():
             self.log_refresh_timer.start()
 
-    def flush_log_queue(self):
-        if not self.volume_data_log_queue:
+    def _apply_rows_to_table(self, rows):
+        if self.table_model.upsert_many(rows):
+            self.live_data_table.resizeColumnsToContents()
+
+    def _on_tab_changed(self, index: int):
+        if self.tab_widget.widget(index) is self.monitoring_tab:
+            self._flush_pending_rows()
+
+    def _flush_pending_rows(self):
+        if not self._pending_rows:
             return
-        db_access_lock = Lock()
-        try:
-            with db_access_lock:
-                db = DatabaseManager(self.db_manager.db_path)
-                for data, remark in self.volume_data_log_queue:
-                    db.log_volume_data(data, remark)
-                db.close()
-        except Exception as e:
-            print("Log queue error:", e)
-        self.volume_data_log_queue.clear()
+        pending = self._pending_rows
+        self._pending_rows = {}
+        self._apply_rows_to_table(pending.values())
 
-    def stop_monitoring(self):
+    def stop_monitoring(self, restart_trading_feed: bool = False):
         if self.monitoring_thread:
+            self.monitoring_thread.blockSignals(True)
             if self.monitoring_thread.isRunning():
                 self.monitoring_thread.stop_monitoring()
                 self.monitoring_thread.quit()
                 if not self.monitoring_thread.wait(5000):
                     print("WARNING: Monitoring thread did not terminate gracefully.")
-            
-            try:
-                self.monitoring_thread.volume_batch_update.disconnect()
-                self.monitoring_thread.alert_triggered.disconnect()
-                self.monitoring_thread.status_changed.disconnect()
-                self.monitoring_thread.error_occurred.disconnect()
-            except TypeError:
-                pass
 
             self.monitoring_thread.deleteLater()
             self.monitoring_thread = None
@@ -934,83 +1284,127 @@ class MainWindow(QMainWindow):
         self.stop_monitor_btn.setEnabled(False)
         self.status_label.setText("Status: Stopped")
 
+        trading_symbol = self.trading_widget.current_symbol
+        if restart_trading_feed and trading_symbol:
+            self._start_specific_symbol_quotation_fetch(trading_symbol)
+
+    def _queue_error(self, title: str, msg: str):
+        self.status_bar.showMessage(f"{title}: {msg}", 5000)
+        self._pending_errors.append(f"{title}: {msg}")
+        if not self.error_flush_timer.isActive():
+            self.error_flush_timer.start()
+
+    def _flush_errors(self):
+        errors = self._pending_errors
+        self._pending_errors = []
+        if not errors:
+            return
+        shown = self._shown_errors + errors
+        self._omitted_errors += max(0, len(shown) - 10)
+        self._shown_errors = shown[-10:]
+        lines = list(self._shown_errors)
+        if self._omitted_errors:
+            lines.insert(0, f"({self._omitted_errors} earlier errors omitted)")
+
+        if self._error_box is None:
+            self._error_box = QMessageBox(QMessageBox.Warning, "Errors", "", QMessageBox.Ok, self)
+            self._error_box.setWindowModality(Qt.NonModal)
+            self._error_box.finished.connect(self._on_error_box_closed)
+        self._error_box.setText("\n".join(lines))
+        self._error_box.show()
+
+    def _on_error_box_closed(self, _result: int):
+        self._shown_errors = []
+        self._omitted_errors = 0
+
+    def _show_toast(self, symbol: str, message: str, price: Optional[float]):
+        price_text = f" @ ₹{price:.2f}" if price is not None else ""
+        self.status_bar.showMessage(f"ALERT: {symbol} - {message}{price_text}", 3000)
+
     def on_alert_triggered(self, symbol: str, combined_message_type_string: str, data: VolumeData):
-        alerts_count = self.db_manager.get_alerts_count_today()
-        self.update_stat_card("Total Alerts Today", str(alerts_count))
+        self._pending_alerts.append((symbol, combined_message_type_string, data))
+        if not self.alert_flush_timer.isActive():
+            self.alert_flush_timer.start()
+
+    def _flush_alerts(self):
+        alerts = self._pending_alerts
+        self._pending_alerts = []
+        if not alerts:
+            return
+
+        symbol, combined_message_type_string, data = alerts[-1]
+        self._show_toast(symbol, combined_message_type_string, data.price)
+        self._roll_alerts_today_count()
+        self._alerts_today_count += len(alerts)
+        self.update_stat_card("Total Alerts Today", str(self._alerts_today_count))
         try:
-            telegram_enabled = self.config.telegram_enabled
-            telegram_bot_token = self.db_manager.get_setting("telegram_bot_token")
-            telegram_chat_id = self.db_manager.get_setting("telegram_chat_id")
+            if self._alert_wave is None:
+                self._alert_wave = sa.WaveObject.from_wave_file("assets/alert.wav")
+            self.thread.start(AlertSoundTask(self._alert_wave))
+        except Exception as e:
+            print(e)
+
+        for symbol, combined_message_type_string, data in alerts:
+            self._dispatch_alert(symbol, combined_message_type_string, data)
 
-            wave_obj = sa.WaveObject.from_wave_file("assets/alert.wav")
-            wave_obj.play()
+    def _dispatch_alert(self, symbol: str, combined_message_type_string: str, data: VolumeData):
+        try:
+            telegram_enabled = self.config.telegram_enabled
+            telegram_bot_token = self.config.telegram_bot_token
+            telegram_chat_id = self.config.telegram_chat_id
 
             if telegram_enabled and telegram_bot_token and telegram_chat_id:
-                try:
-                    message_parts = []
-                    message_parts.append("🚨 STOCK ALERT 🚨")
-                    message_parts.append(f"ALERT! {symbol} - {data.instrument_type if data.instrument_type else 'N/A'} - {combined_message_type_string}")
-                    
-                    if data.ratio is not None:
-                        message_parts.append(f"Ratio: {data.ratio:.2f}")
-                    
-                    ohlc_info = (
-                        f"₹{data.price:.2f}(LTP) -- "
-                        f"₹{data.open_price:.2f} (O) -- "
-                        f"₹{data.high_price:.2f}(H) -- "
-                        f"₹{data.low_price:.2f} (L) -- "
-                        f"₹{data.close_price:.2f} (C)"
-                    )
-                    message_parts.append(ohlc_info)
-
-                    tbq_info = []
-                    tsq_info = []
-
-                    is_tbq_alert = "tbq" in combined_message_type_string.lower()
-                    is_tsq_alert = "tsq" in combined_message_type_string.lower()
-
-                    if is_tbq_alert:
-                        if data.day_high_tbq is not None:
-                            tbq_info.append(f"TBQ Day High: {data.day_high_tbq:,}")
-                        if data.day_low_tbq is not None:
-                            if "spike" not in combined_message_type_string.lower():
-                                tbq_info.append(f"TBQ Day Low: {data.day_low_tbq:,}")
-
-                    if is_tsq_alert:
-                        if data.day_high_tsq is not None:
-                            tsq_info.append(f"TSQ Day High: {data.day_high_tsq:,}")
-                        if data.day_low_tsq is not None:
-                            if "spike" not in combined_message_type_string.lower():
-                                tsq_info.append(f"TSQ Day Low: {data.day_low_tsq:,}")
-                    
-                    tbq_tsq_line = []
-                    if tbq_info:
-                        tbq_tsq_line.append(" -- ".join(tbq_info))
-                    if tsq_info:
-                        tbq_tsq_line.append(" -- ".join(tsq_info))
-                    
-                    if tbq_tsq_line:
-                        message_parts.append(" & ".join(tbq_tsq_line))
-
-                    formatted_time = datetime.datetime.strptime(data.timestamp, "%Y-%m-%d %H:%M:%S").strftime("%I:%M:%S %p")
-                    formatted_date = datetime.datetime.strptime(data.timestamp, "%Y-%m-%d %H:%M:%S").strftime("%d-%m-%Y")
-                    message_parts.append(f"Time: {formatted_time}")
-                    message_parts.append(f"Date: {formatted_date}")
-
-                    telegram_message = "\n".join(message_parts)
-                    send_telegram_message(telegram_bot_token, telegram_chat_id, telegram_message)
-                except Exception as e:
-                    print(e)
+                if not self._telegram_slots.acquire(blocking=False):
+                    print(f"Telegram queue full ({_TELEGRAM_MAX_PENDING} pending); dropping alert for {symbol}.")
+                else:
+                    try:
+                        telegram_message = self._format_telegram_alert(symbol, combined_message_type_string, data)
+                        future = self._telegram_pool.submit(send_telegram_message, telegram_bot_token, telegram_chat_id, telegram_message)
+                        future.add_done_callback(lambda f, symbol=symbol: self._on_telegram_sent(f, symbol))
+                    except Exception as e:
+                        self._telegram_slots.release()
+                        print(e)
 
             if self.config.auto_trade_enabled:
                 self.execute_auto_trade(data)
         except Exception as e:
             print(e)
     
+    @staticmethod
+    def _format_telegram_alert(symbol: str, combined_message_type_string: str, data: VolumeData) -> str:
+        combined_lower = combined_message_type_string.lower()
+        is_spike = "spike" in combined_lower
+        tbq_info = " -- ".join(filter(None, (
+            f"TBQ Day High: {data.day_high_tbq:,}" if data.day_high_tbq is not None else None,
+            f"TBQ Day Low: {data.day_low_tbq:,}" if data.day_low_tbq is not None and not is_spike else None
+        ))) if "tbq" in combined_lower else ""
+        tsq_info = " -- ".join(filter(None, (
+            f"TSQ Day High: {data.day_high_tsq:,}" if data.day_high_tsq is not None else None,
+            f"TSQ Day Low: {data.day_low_tsq:,}" if data.day_low_tsq is not None and not is_spike else None
+        ))) if "tsq" in combined_lower else ""
+        alert_time = data.ts or datetime.datetime.strptime(data.timestamp, "%Y-%m-%d %H:%M:%S")
+
+        parts = (
+            "🚨 STOCK ALERT 🚨",
+            f"ALERT! {symbol} - {data.instrument_type or 'N/A'} - {combined_message_type_string}",
+            f"Ratio: {data.ratio:.2f}" if data.ratio is not None else None,
+            f"₹{data.price:.2f}(LTP) -- ₹{data.open_price:.2f} (O) -- ₹{data.high_price:.2f}(H) -- "
+            f"₹{data.low_price:.2f} (L) -- ₹{data.close_price:.2f} (C)",
+            " & ".join(filter(None, (tbq_info, tsq_info))),
+            f"Time: {alert_time:%I:%M:%S %p}",
+            f"Date: {alert_time:%d-%m-%Y}"
+        )
+        return "\n".join(part for part in parts if part)
+
+    def _on_telegram_sent(self, future, symbol: str):
+        self._telegram_slots.release()
+        if future.exception() is not None or not future.result():
+            self.telegram_failed.emit(symbol)
+
     def execute_auto_trade(self, data: VolumeData):
         try:
-            budget_cap = float(self.db_manager.get_setting("budget_cap", "0.0"))
-            trade_ltp_percent = float(self.db_manager.get_setting("trade_ltp_percentage", "0.0"))
+            budget_cap = self.config.budget_cap
+            trade_ltp_percent = self.config.trade_ltp_percentage
 
             if budget_cap <= 0 or trade_ltp_percent <= 0:
                 print(f"Auto trade skipped due to invalid budget_cap ({budget_cap}) or trade_ltp_percentage ({trade_ltp_percent}).")
@@ -1035,26 +1429,32 @@ class MainWindow(QMainWindow):
                 "alert_id": None
             }
 
-            dialog = TradingDialog(
-                db_manager=self.db_manager,
-                initial_data=dialog_data,
-                parent=self,
-                kite_instance=self.kite,
-                config=self.config
-            )
+            dialog = self._auto_trade_dialog
+            if dialog is None or dialog.isVisible():
+                dialog = TradingDialog(
+                    db_manager=self.db_manager,
+                    initial_data=dialog_data,
+                    parent=self,
+                    kite_instance=self.kite,
+                    config=self.config
+                )
+                dialog.order_placed.connect(self.trading_widget.refresh_trade_history_table)
+                if self._auto_trade_dialog is None:
+                    self._auto_trade_dialog = dialog
+            else:
+                dialog.kite = self.kite
+                dialog.main_app_config = self.config
+                dialog.set_data(dialog_data)
 
-            dialog.order_placed.connect(self.trading_widget.refresh_trade_history_table)
             dialog.exec_()
+            if dialog is not self._auto_trade_dialog:
+                dialog.deleteLater()
 
         except Exception as e:
             print(f"Error during auto trade: {e}")
 
     def _get_exchange_for_instrument_type(self, instrument_type: str) -> str:
-        if instrument_type == 'EQ':
-            return self.kite.EXCHANGE_NSE
-        elif instrument_type in ['FUT', 'CE', 'PE']:
-            return self.kite.EXCHANGE_NFO
-        return self.kite.EXCHANGE_NSE
+        return _EXCHANGE_BY_INSTRUMENT_TYPE.get(instrument_type, KiteConnect.EXCHANGE_NSE)
 
     def open_trading_dialog(self, data: Dict[str, Any]):
         dialog = TradingDialog(self.db_manager, initial_data=data, kite_instance=self.kite, config=self.config)
@@ -1096,7 +1496,6 @@ class MainWindow(QMainWindow):
             self.status_label.setText("Status: Stopped")
 
     def closeEvent(self, event):
-        self._stop_specific_symbol_quotation_fetch()
         self.trading_widget.stop_account_info_timer()
 
         if self.monitoring_thread and self.monitoring_thread.isRunning():
@@ -1108,12 +1507,19 @@ class MainWindow(QMainWindow):
 
             if reply == QMessageBox.Yes:
                 self.stop_monitoring()
+                self._shutdown_background_workers()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self._shutdown_background_workers()
             event.accept()
     
+    def _shutdown_background_workers(self):
+        self._shutdown_quotation_fetcher()
+        self.volume_logger.stop()
+        self._telegram_pool.shutdown(wait=False)
+
     def close_application(self):
         self.close()
 
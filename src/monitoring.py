@@ -1,7 +1,7 @@
 import datetime
 import time
 import threading
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from PyQt5.QtCore import QThread, pyqtSignal, QTime, QTimer
 try:
     from kiteconnect import KiteConnect
@@ -9,7 +9,7 @@ except ImportError:
     KiteConnect = None
 from database import DatabaseManager
 from config import AlertConfig
-from volume_data import VolumeData
+from volume_data import VolumeData, format_display_row
 from stock_management import InstrumentManager
 
 
@@ -26,8 +26,9 @@ class MonitoringThread(QThread):
     volume_batch_update = pyqtSignal(list)
 
     def __init__(self, kite, config: AlertConfig, db_path: str,
-                 stock_manager: InstrumentManager, futures_manager: InstrumentManager, options_manager: InstrumentManager):
-        super().__init__()
+                 stock_manager: InstrumentManager, futures_manager: InstrumentManager, options_manager: InstrumentManager,
+                 parent=None):
+        super().__init__(parent)
         self.kite = kite
         self._stop_event = threading.Event()
         self.config = config
@@ -37,6 +38,10 @@ class MonitoringThread(QThread):
         self.flag = False
         self.monitored_symbols = []
         self.timer = None
+        self._last_status = None
+        self._token_batches: Optional[List[Tuple[List[str], Dict]]] = None
+        self._token_count = 0
+        self._unresolved_symbols: List[str] = []
 
         self.symbol_daily_max_tbq: Dict[str, Optional[int]] = {}
         self.symbol_daily_min_tbq: Dict[str, Optional[int]] = {}
@@ -57,9 +62,13 @@ class MonitoringThread(QThread):
 
     def set_monitored_symbols(self, symbols: List[str]):
         self.monitored_symbols = symbols
+        self.invalidate_token_batches()
+
+    def invalidate_token_batches(self):
+        self._token_batches = None
 
     def run(self):
-        self.status_changed.emit("Monitoring started...")
+        self._set_status("Monitoring started...")
         self.db_manager = DatabaseManager(self.db_path)
 
         self.timer = QTimer()
@@ -71,13 +80,18 @@ class MonitoringThread(QThread):
 
         self.exec_()
     
+    def _set_status(self, status: str):
+        if status != self._last_status:
+            self._last_status = status
+            self.status_changed.emit(status)
+
     def _monitor_once(self):
         if not self.running or self.paused or self._stop_event.is_set():
             return
 
         current_time = QTime.currentTime().toPyTime()
         if not datetime.time(9, 0) <= current_time <= datetime.time(15, 30):
-            self.status_changed.emit("Market is closed")
+            self._set_status("Market is closed")
             self.stop_monitoring()
             return
 
@@ -89,43 +103,71 @@ class MonitoringThread(QThread):
             self.symbol_daily_min_tsq.clear()
             self.last_reset_date = today
 
+        token_batches = self._current_token_batches()
+        if token_batches:
+            self._set_status(f"Monitoring {self._token_count} symbols...")
+            self._fetch_and_process_live_data(token_batches)
+
+    def _current_token_batches(self) -> List[Tuple[List[str], Dict]]:
+        if self._token_batches is not None and self._unresolved_symbols:
+            if any(self._resolves(symbol) for symbol in self._unresolved_symbols):
+                self._token_batches = None
+        if self._token_batches is None:
+            self._token_batches = self._build_token_batches()
+        return self._token_batches
+
+    def _lookup_instrument(self, symbol: str):
+        return (
+            self.stock_manager.get_tradable_instrument_details(symbol)
+            or self.futures_manager.get_tradable_instrument_details(symbol)
+            or self.options_manager.get_tradable_instrument_details(symbol)
+        )
+
+    def _resolves(self, symbol: str) -> bool:
+        try:
+            return bool(self._lookup_instrument(symbol))
+        except Exception:
+            return False
+
+    def _build_token_batches(self) -> List[Tuple[List[str], Dict]]:
         tokens = []
         symbol_map = {}
+        unresolved = []
 
         for symbol in self.monitored_symbols:
             try:
-                instrument_details = (
-                    self.stock_manager.get_tradable_instrument_details(symbol)
-                    or self.futures_manager.get_tradable_instrument_details(symbol)
-                    or self.options_manager.get_tradable_instrument_details(symbol)
-                )
+                instrument_details = self._lookup_instrument(symbol)
 
-                if instrument_details:
+                if not instrument_details:
+                    unresolved.append(symbol)
+                else:
                     instrument_token = instrument_details[3]
                     market = instrument_details[2]
                     token_key = f"{market}:{symbol}"
                     tokens.append(token_key)
                     symbol_map[token_key] = {
+                        'symbol': symbol,
                         'instrument_token': instrument_token,
                         'type': instrument_details[1],
                         'expiry': instrument_details[4] if len(instrument_details) > 4 else None,
                         'strike': instrument_details[5] if len(instrument_details) > 5 else None
                     }
             except Exception as e:
+                unresolved.append(symbol)
                 self.error_occurred.emit(f"Error fetching data for {symbol}: {str(e)}")
 
-        if tokens:
-            self.status_changed.emit(f"Monitoring {len(tokens)} symbols...")
-            self._fetch_and_process_live_data(tokens, symbol_map)
-
-    def _fetch_and_process_live_data(self, tokens: List[str], symbol_map: Dict):
-        all_volume_data = []
+        self._unresolved_symbols = unresolved
+        self._token_count = len(tokens)
         batch_size = 25
+        return [
+            (batch, {token: symbol_map[token] for token in batch})
+            for batch in (tokens[i:i + batch_size] for i in range(0, len(tokens), batch_size))
+        ]
 
-        for i in range(0, len(tokens), batch_size):
-            batch = tokens[i:i + batch_size]
-            batch_map = {symbol: symbol_map[symbol] for symbol in batch}
+    def _fetch_and_process_live_data(self, token_batches: List[Tuple[List[str], Dict]]):
+        all_volume_data = []
 
+        for batch, batch_map in token_batches:
             try:
                 quote = self.kite.quote(batch)
                 processed_batch = self._process_quote_data(quote, batch_map)
@@ -141,6 +183,8 @@ class MonitoringThread(QThread):
     def _process_quote_data(self, quote: Dict, symbol_map: Dict) -> List[VolumeData]:
         result = []
         threshold = self.config.tbq_tsq_threshold
+        now_dt = datetime.datetime.now()
+        now = now_dt.strftime("%Y-%m-%d %H:%M:%S")
 
         for token, data in quote.items():
             if not self.running:
@@ -149,8 +193,8 @@ class MonitoringThread(QThread):
             if token not in symbol_map:
                 continue
 
-            symbol = token.split(':')[1]
             details = symbol_map[token]
+            symbol = details['symbol']
             tbq = data.get('buy_quantity', 0)
             tsq = data.get('sell_quantity', 0)
             last_price = data.get('last_price', 0.0)
@@ -169,7 +213,6 @@ class MonitoringThread(QThread):
             tsq_change = (tsq - prev_tsq) / prev_tsq if prev_tsq else 0.0
 
             ratio = tbq / tsq if tsq else (tbq if tbq else 0.0)
-            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
             self.symbol_daily_max_tbq[symbol] = max(tbq, self.symbol_daily_max_tbq.get(symbol, tbq))
             self.symbol_daily_min_tbq[symbol] = min(tbq, self.symbol_daily_min_tbq.get(symbol, tbq))
@@ -196,7 +239,8 @@ class MonitoringThread(QThread):
                 day_high_tbq=self.symbol_daily_max_tbq[symbol],
                 day_low_tbq=self.symbol_daily_min_tbq[symbol],
                 day_high_tsq=self.symbol_daily_max_tsq[symbol],
-                day_low_tsq=self.symbol_daily_min_tsq[symbol]
+                day_low_tsq=self.symbol_daily_min_tsq[symbol],
+                ts=now_dt
             )
 
             remark = ""
@@ -217,6 +261,7 @@ class MonitoringThread(QThread):
 
             volume_data.remark = remark
             volume_data.alert_triggered = str(triggered)
+            volume_data.display_row = format_display_row(volume_data)
             if triggered:
                 self.alert_triggered.emit(symbol, remark, volume_data)
             result.append(volume_data)
@@ -235,4 +280,5 @@ class MonitoringThread(QThread):
         self.paused = True
 
     def resume_monitoring(self):
-        self.paused = False
\ No newline at end of file
+        self.paused = False
+        self._last_status = None
\ No newline at end of file
@@ -1,4 +1,3 @@
-import datetime
 import traceback
 from typing import List, Dict, Any, Tuple, Optional
 from PyQt5.QtWidgets import (
@@ -353,36 +352,41 @@ class TradingWidget(QWidget):
                 self.detail_labels[label_key].setText("N/A")
 
 
+    @property
+    def current_symbol(self) -> Optional[str]:
+        return self.current_selected_instrument[0] if self.current_selected_instrument else None
+
     def update_quotation_data(self, data: VolumeData):
-        if self.current_selected_instrument and data.symbol == self.current_selected_instrument[0]:
-            self.live_quotation_data[data.symbol] = data
-
-            current_ltp_label = self.detail_labels["last_traded_price_(ltp)"]
-            prev_price = self.live_quotation_data[data.symbol].price
-
-            if data.price is not None:
-                current_ltp_label.setText(f"₹{data.price:.2f}")
-                if prev_price is not None:
-                    if data.price > prev_price:
-                        current_ltp_label.setStyleSheet("color: green;")
-                    elif data.price < prev_price:
-                        current_ltp_label.setStyleSheet("color: red;")
-                    else:
-                        current_ltp_label.setStyleSheet("color: black;")
+        if data.symbol != self.current_symbol:
+            return
+        previous_data = self.live_quotation_data.get(data.symbol)
+        self.live_quotation_data[data.symbol] = data
+        current_ltp_label = self.detail_labels["last_traded_price_(ltp)"]
+        prev_price = previous_data.price if previous_data else None
+
+        if data.price is not None:
+            current_ltp_label.setText(f"₹{data.price:.2f}")
+            if prev_price is not None:
+                if data.price > prev_price:
+                    current_ltp_label.setStyleSheet("color: green;")
+                elif data.price < prev_price:
+                    current_ltp_label.setStyleSheet("color: red;")
                 else:
                     current_ltp_label.setStyleSheet("color: black;")
             else:
-                current_ltp_label.setText("N/A")
                 current_ltp_label.setStyleSheet("color: black;")
+        else:
+            current_ltp_label.setText("N/A")
+            current_ltp_label.setStyleSheet("color: black;")
 
-            self.detail_labels["open"].setText(f"₹{data.open_price:.2f}" if data.open_price is not None else "N/A")
-            self.detail_labels["high"].setText(f"₹{data.high_price:.2f}" if data.high_price is not None else "N/A")
-            self.detail_labels["low"].setText(f"₹{data.low_price:.2f}" if data.low_price is not None else "N/A")
-            self.detail_labels["close"].setText(f"₹{data.close_price:.2f}" if data.close_price is not None else "N/A")
-            self.detail_labels["total_buy_quantity_(tbq)"].setText(f"{data.tbq:,}" if data.tbq is not None else "N/A")
-            self.detail_labels["total_sell_quantity_(tsq)"].setText(f"{data.tsq:,}" if data.tsq is not None else "N/A")
-            self.detail_labels["bid/ask_ratio"].setText(f"{data.ratio:.2f}" if data.ratio is not None else "N/A")
-            self.detail_labels["timestamp"].setText(data.timestamp.split(' ')[1] if data.timestamp else "N/A")
+        self.detail_labels["open"].setText(f"₹{data.open_price:.2f}" if data.open_price is not None else "N/A")
+        self.detail_labels["high"].setText(f"₹{data.high_price:.2f}" if data.high_price is not None else "N/A")
+        self.detail_labels["low"].setText(f"₹{data.low_price:.2f}" if data.low_price is not None else "N/A")
+        self.detail_labels["close"].setText(f"₹{data.close_price:.2f}" if data.close_price is not None else "N/A")
+        self.detail_labels["total_buy_quantity_(tbq)"].setText(f"{data.tbq:,}" if data.tbq is not None else "N/A")
+        self.detail_labels["total_sell_quantity_(tsq)"].setText(f"{data.tsq:,}" if data.tsq is not None else "N/A")
+        self.detail_labels["bid/ask_ratio"].setText(f"{data.ratio:.2f}" if data.ratio is not None else "N/A")
+        self.detail_labels["timestamp"].setText(data.timestamp[11:19] if data.timestamp else "N/A")
 
 
     def on_trade_button_clicked(self, transaction_type: str):
@@ -422,11 +426,8 @@ class TradingWidget(QWidget):
             (trade_id, timestamp_str, symbol, instrument_type, transaction_type,
              quantity, price, order_type, product_type, status, message, order_id, alert_id) = trade
 
-            # Format timestamp for display
-            formatted_timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S").strftime("%Y-%m-%d %H:%M:%S")
-
             items = [
-                QTableWidgetItem(formatted_timestamp),
+                QTableWidgetItem(timestamp_str),
                 QTableWidgetItem(symbol),
                 QTableWidgetItem(instrument_type),
                 QTableWidgetItem(transaction_type),
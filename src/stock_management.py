@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import traceback
 from PyQt5.QtCore import Qt, QStringListModel, pyqtSignal, QObject
 from PyQt5.QtWidgets import (
@@ -26,6 +26,7 @@ class InstrumentManager(QObject):
         
         self.exchange = self._get_default_exchange(instrument_type)
         self.all_tradable_symbols: List[Tuple[str, str, str, int, Optional[str], Optional[float]]] = []
+        self._details_by_symbol: Dict[str, Tuple[str, str, str, int, Optional[str], Optional[float]]] = {}
         self.load_all_tradable_instruments_from_db()
 
         self.user_selected_symbols: List[str] = []
@@ -48,11 +49,10 @@ class InstrumentManager(QObject):
         
         try:
             filtered_df = self.filter_instruments(raw_instruments_df)
-            instruments_to_save = [
-                (row['tradingsymbol'], row['instrument_type'], row['exchange'],
-                 row['instrument_token'], row['expiry'], row['strike'])
-                for index, row in filtered_df.iterrows()
-            ]
+            instruments_to_save = list(zip(
+                *(filtered_df[col].tolist() for col in ('tradingsymbol', 'instrument_type', 'exchange',
+                                                         'instrument_token', 'expiry', 'strike'))
+            ))
             if instruments_to_save:
                 thread_db_manager.bulk_save_tradable_instruments(instruments_to_save)
             else:
@@ -100,6 +100,7 @@ class InstrumentManager(QObject):
             exchange=self.exchange,
             option_category=option_cat
         )
+        self._details_by_symbol = {instrument[0]: instrument for instrument in reversed(self.all_tradable_symbols)}
 
     def get_all_tradable_instruments(self) -> List[Tuple[str, str, str, int, Optional[str], Optional[float]]]:
         return self.all_tradable_symbols
@@ -112,7 +113,7 @@ class InstrumentManager(QObject):
 
     def add_user_instrument(self, symbol: str):
         if symbol not in self.user_selected_symbols:
-            if not any(inst[0] == symbol for inst in self.all_tradable_symbols):
+            if symbol not in self._details_by_symbol:
                 QMessageBox.warning(None, "Invalid Symbol", f"'{symbol}' is not a valid tradable {self.instrument_type} symbol. Please select from the available list.")
                 return False
 
@@ -134,10 +135,7 @@ class InstrumentManager(QObject):
 
 
     def get_tradable_instrument_details(self, symbol: str) -> Optional[Tuple[str, str, str, int, Optional[str], Optional[float]]]:
-        for instrument in self.all_tradable_symbols:
-            if instrument[0] == symbol:
-                return instrument
-        return None
+        return self._details_by_symbol.get(symbol)
 class InstrumentSelectionWidget(QWidget):
     def __init__(self, instrument_manager: InstrumentManager, display_name: str):
         super().__init__()
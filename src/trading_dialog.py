@@ -177,6 +177,17 @@ class TradingDialog(QDialog):
         else:
             self.quantity_spinbox.setValue(1)
 
+    def set_data(self, initial_data: dict):
+        self.initial_data = initial_data if initial_data else {}
+        if self.main_app_config is not None:
+            self.budget_cap = self.main_app_config.budget_cap
+        self.product_type_combo.setCurrentText("NRML")
+        self.order_type_combo.setCurrentText("LIMIT")
+        self.stop_loss_percent_spin.setValue(0.00)
+        self.target_profit_percent_spin.setValue(0.00)
+        self.trigger_price_spinbox.setValue(0.00)
+        self._populate_initial_data()
+
     def _toggle_price_and_trigger_fields(self):
         order_type = self.order_type_combo.currentText()
         if order_type == "MARKET":
@@ -92,10 +92,12 @@ class RequestTokenServer(QObject):
         if self._server_thread and self._server_thread.is_alive():
             self._server_thread.join(timeout=1) # Wait for thread to finish
 
-def send_telegram_message(bot_token: str, chat_id: str, message: str):
+_telegram_session = requests.Session()
+
+def send_telegram_message(bot_token: str, chat_id: str, message: str) -> bool:
     if not bot_token or not chat_id:
         print("[Telegram] Missing bot_token or chat_id.")
-        return
+        return False
 
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
     payload = {
@@ -105,9 +107,10 @@ def send_telegram_message(bot_token: str, chat_id: str, message: str):
     }
 
     try:
-        response = requests.post(url, data=payload, timeout=5)
+        response = _telegram_session.post(url, data=payload, timeout=5)
         response.raise_for_status()
         print("[Telegram] Message sent.")
+        return True
     except Exception as e:
         print(f"[Telegram] Requests failed: {e}. Falling back to urllib.")
         try:
@@ -115,5 +118,7 @@ def send_telegram_message(bot_token: str, chat_id: str, message: str):
             req = urllib.request.Request(url, data=data, method='POST')
             with urllib.request.urlopen(req, timeout=5) as resp:
                 print(f"[Telegram] Sent via urllib. Status: {resp.status}")
+                return True
         except Exception as e2:
-            print(f"[Telegram] Urllib failed: {e2}")
\ No newline at end of file
+            print(f"[Telegram] Urllib failed: {e2}")
+            return False
\ No newline at end of file
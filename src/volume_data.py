@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
 class MonitoringStatus(Enum):
     STOPPED = "Stopped"
@@ -8,7 +9,7 @@ class MonitoringStatus(Enum):
     PAUSED = "Paused"
     ERROR = "Error"
 
-@dataclass
+@dataclass(slots=True)
 class VolumeData:
     timestamp: str
     symbol: str
@@ -31,4 +32,23 @@ class VolumeData:
     day_high_tbq: Optional[int] = None
     day_low_tbq: Optional[int] = None
     day_high_tsq: Optional[int] = None 
-    day_low_tsq: Optional[int] = None
\ No newline at end of file
+    day_low_tsq: Optional[int] = None
+    ts: Optional[datetime] = field(default=None, repr=False, compare=False)
+    display_row: Optional[Tuple[str, ...]] = field(default=None, repr=False, compare=False)
+
+def format_display_row(volume_data: VolumeData) -> Tuple[str, ...]:
+    return (
+        volume_data.timestamp,
+        volume_data.symbol,
+        volume_data.instrument_type,
+        str(volume_data.tbq),
+        f"{volume_data.tbq_change_percent:.2f}%",
+        str(volume_data.tsq),
+        f"{volume_data.tsq_change_percent:.2f}%",
+        volume_data.remark or "",
+        f"{volume_data.price:.2f}",
+        f"{volume_data.open_price:.2f}",
+        f"{volume_data.high_price:.2f}",
+        f"{volume_data.low_price:.2f}",
+        f"{volume_data.close_price:.2f}"
+    )
@@ -0,0 +1,66 @@
+import types
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+for module in ("PyQt5", "simpleaudio", "pyqtspinner", "kiteconnect", "pandas"):
+    pytest.importorskip(module)
+
+from main import MainWindow
+
+
+def _window(trading_symbol, fetcher_symbol):
+    worker = Mock(symbol=fetcher_symbol)
+    window = SimpleNamespace(
+        trading_widget=SimpleNamespace(current_symbol=trading_symbol),
+        quotation_fetcher_worker=worker,
+    )
+    window._stop_specific_symbol_quotation_fetch = types.MethodType(
+        MainWindow._stop_specific_symbol_quotation_fetch, window
+    )
+    return window, worker
+
+
+def test_starting_monitoring_stops_fetcher_for_selected_trading_symbol():
+    window, worker = _window("INFY", "INFY")
+
+    MainWindow._hand_trading_symbol_to_monitoring(window, ["RELIANCE", "INFY"])
+
+    worker.clear_instrument.assert_called_once_with()
+
+
+def test_starting_monitoring_keeps_fetcher_for_unmonitored_trading_symbol():
+    window, worker = _window("INFY", "INFY")
+
+    MainWindow._hand_trading_symbol_to_monitoring(window, ["RELIANCE"])
+
+    worker.clear_instrument.assert_not_called()
+
+
+def _stopped_window(trading_symbol):
+    return SimpleNamespace(
+        monitoring_thread=None,
+        start_monitor_btn=Mock(),
+        toggle_pause_resume_btn=Mock(),
+        stop_monitor_btn=Mock(),
+        status_label=Mock(),
+        trading_widget=SimpleNamespace(current_symbol=trading_symbol),
+        _start_specific_symbol_quotation_fetch=Mock(),
+    )
+
+
+def test_stop_monitoring_leaves_trading_feed_alone_by_default():
+    window = _stopped_window("INFY")
+
+    MainWindow.stop_monitoring(window)
+
+    window._start_specific_symbol_quotation_fetch.assert_not_called()
+
+
+def test_stop_button_path_restarts_trading_feed():
+    window = _stopped_window("INFY")
+
+    MainWindow.stop_monitoring(window, restart_trading_feed=True)
+
+    window._start_specific_symbol_quotation_fetch.assert_called_once_with("INFY")
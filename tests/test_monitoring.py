@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import pytest
+
+for module in ("PyQt5", "pyqtspinner", "pandas"):
+    pytest.importorskip(module)
+
+from monitoring import MonitoringThread
+
+
+def _manager(instruments):
+    return SimpleNamespace(get_tradable_instrument_details=instruments.get)
+
+
+def _thread(stocks, symbols):
+    thread = MonitoringThread(
+        kite=None,
+        config=SimpleNamespace(tbq_tsq_threshold=0.0),
+        db_path=":memory:",
+        stock_manager=_manager(stocks),
+        futures_manager=_manager({}),
+        options_manager=_manager({}),
+    )
+    thread.set_monitored_symbols(symbols)
+    return thread
+
+
+def _keys(token_batches):
+    return [key for batch, _ in token_batches for key in batch]
+
+
+def test_late_resolved_symbol_is_picked_up():
+    stocks = {"RELIANCE": ("RELIANCE", "EQ", "NSE", 738561, None, None)}
+    thread = _thread(stocks, ["RELIANCE", "INFY"])
+
+    assert _keys(thread._current_token_batches()) == ["NSE:RELIANCE"]
+
+    stocks["INFY"] = ("INFY", "EQ", "NSE", 408065, None, None)
+
+    assert _keys(thread._current_token_batches()) == ["NSE:RELIANCE", "NSE:INFY"]
+
+
+def test_resolved_batches_are_reused_until_invalidated():
+    stocks = {"RELIANCE": ("RELIANCE", "EQ", "NSE", 738561, None, None)}
+    thread = _thread(stocks, ["RELIANCE"])
+
+    first = thread._current_token_batches()
+    assert thread._current_token_batches() is first
+
+    stocks["RELIANCE"] = ("RELIANCE", "EQ", "BSE", 128083204, None, None)
+    thread.invalidate_token_batches()
+
+    assert _keys(thread._current_token_batches()) == ["BSE:RELIANCE"]